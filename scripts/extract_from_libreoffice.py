@@ -4,12 +4,44 @@ Extract French dictionary from LibreOffice Hunspell dictionary
 Finds fr_FR.dic automatically and extracts 5-letter words
 """
 
+import logging
+import mmap
 import os
 import sys
 import re
 from pathlib import Path
 from collections import defaultdict
 
+logger = logging.getLogger(__name__)
+
+# French ligatures and their multi-character expansions; built once at import
+# and compiled to a str.translate table so expansion is one C call per word
+_LIGATURE_MAP = {
+    'œ': 'oe',
+    'æ': 'ae',
+    'ﬁ': 'fi',
+    'ﬂ': 'fl',
+}
+_LIGATURE_TABLE = str.maketrans(_LIGATURE_MAP)
+
+# Every codepoint a French dictionary word may contain (accents included);
+# membership beats calling str.isalpha on each character
+_ALLOWED_CHARS = frozenset(
+    'abcdefghijklmnopqrstuvwxyz'
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    'àâäéèêëïîôöœùûüæçñ'
+    'ÀÂÄÉÈÊËÏÎÔÖŒÙÛÜÆÇÑ'
+)
+
+# Roman-numeral detection: compiled once, with a cheap membership
+# prefilter so most words never reach the regex engine
+_ROMAN_CHARS = frozenset('IVXLCDMivxlcdm')
+_ROMAN_RE = re.compile(r'[IVXLCDMivxlcdm]{2,}')
+
+# Hunspell line format is word/tags: grab everything before the first
+# slash (or end of line) in one C-level scan of the whole buffer
+_DIC_WORD_RE = re.compile(rb'(?m)^[^/\r\n]+')
+
 class LibreOfficeExtractor:
     """Extract French words from LibreOffice Hunspell dictionary"""
 
@@ -19,62 +51,46 @@ class LibreOfficeExtractor:
 
     def find_libreoffice_dict(self):
         """Find LibreOffice French dictionary"""
-        print("🔍 Searching for LibreOffice French dictionary...")
-        print(f"📍 Current working directory: {Path.cwd()}")
-        print(f"📍 Script directory: {Path(__file__).parent}")
-
-        # Check data directory
-        data_dic = Path(__file__).parent.parent / "data" / "fr_FR.dic"
-        print(f"🔎 Checking data directory: {data_dic}")
-        if data_dic.exists():
-            print(f"✅ Found in data directory: {data_dic}")
-            return str(data_dic)
-            
-        # Check current directory
-        cwd_dic = Path.cwd() / "fr_FR.dic"
-        print(f"🔎 Checking: {cwd_dic}")
-        if cwd_dic.exists():
-            print(f"✅ Found in current directory: {cwd_dic}")
-            return str(cwd_dic)
-        
-        # Check script directory
-        script_dic = Path(__file__).parent / "fr_FR.dic"
-        print(f"🔎 Checking script directory: {script_dic}")
-        if script_dic.exists():
-            print(f"✅ Found in script directory: {script_dic}")
-            return str(script_dic)
-
-        search_paths = [
+        logger.info("🔍 Searching for LibreOffice French dictionary...")
+        logger.debug("📍 Current working directory: %s", Path.cwd())
+        logger.debug("📍 Script directory: %s", Path(__file__).parent)
+
+        # Candidate .dic files, most likely first; one stat call each and
+        # the scan stops at the first hit
+        candidates = (
+            # Repo data directory, current directory, script directory
+            Path(__file__).parent.parent / "data" / "fr_FR.dic",
+            Path.cwd() / "fr_FR.dic",
+            Path(__file__).parent / "fr_FR.dic",
+
             # Windows common locations
-            Path("C:/Program Files/LibreOffice/share/dictionaries/fr_FR"),
-            Path("C:/Program Files (x86)/LibreOffice/share/dictionaries/fr_FR"),
+            Path("C:/Program Files/LibreOffice/share/dictionaries/fr_FR/fr_FR.dic"),
+            Path("C:/Program Files (x86)/LibreOffice/share/dictionaries/fr_FR/fr_FR.dic"),
 
             # macOS
-            Path.home() / "Applications" / "LibreOffice.app" / "Contents" / "Resources" / "dictionaries" / "fr_FR",
-            Path("/Applications/LibreOffice.app/Contents/Resources/dictionaries/fr_FR"),
+            Path.home() / "Applications/LibreOffice.app/Contents/Resources/dictionaries/fr_FR/fr_FR.dic",
+            Path("/Applications/LibreOffice.app/Contents/Resources/dictionaries/fr_FR/fr_FR.dic"),
 
             # Linux common locations
-            Path("/usr/share/hunspell"),
-            Path("/usr/share/dict"),
-            Path("/opt/libreoffice/share/dictionaries/fr_FR"),
-            Path(os.path.expanduser("~/.local/share/hunspell")),
-        ]
-
-        print("\n📂 Checking common LibreOffice locations...")
-
-        for path in search_paths:
-            if path.exists():
-                dic_file = path / "fr_FR.dic"
-                if dic_file.exists():
-                    print(f"✅ Found: {dic_file}")
-                    return str(dic_file)
-
-        print("\n❌ LibreOffice French dictionary not found!")
-        print("\n💡 Solutions:")
-        print("   1. Place fr_FR.dic in the current directory")
-        print("   2. Install LibreOffice: brew install libreoffice (macOS)")
-        print("   3. Or: sudo apt-get install libreoffice (Linux)")
-        print("   4. Manually: python extract_from_libreoffice.py /path/to/fr_FR.dic")
+            Path("/usr/share/hunspell/fr_FR.dic"),
+            Path("/usr/share/dict/fr_FR.dic"),
+            Path("/opt/libreoffice/share/dictionaries/fr_FR/fr_FR.dic"),
+            Path(os.path.expanduser("~/.local/share/hunspell")) / "fr_FR.dic",
+        )
+
+        logger.debug("📂 Checking known locations...")
+
+        dic_file = next((p for p in candidates if p.exists()), None)
+        if dic_file:
+            logger.info("✅ Found: %s", dic_file)
+            return str(dic_file)
+
+        logger.error("❌ LibreOffice French dictionary not found!")
+        logger.info("💡 Solutions:")
+        logger.info("   1. Place fr_FR.dic in the current directory")
+        logger.info("   2. Install LibreOffice: brew install libreoffice (macOS)")
+        logger.info("   3. Or: sudo apt-get install libreoffice (Linux)")
+        logger.info("   4. Manually: python extract_from_libreoffice.py /path/to/fr_FR.dic")
 
         return None
 
@@ -88,109 +104,107 @@ class LibreOfficeExtractor:
             # If resolve() fails on broken symlinks or special paths, keep expanded path
             pass
 
-        print(f"\n📖 Reading dictionary from: {dic_path}")
+        logger.info("📖 Reading dictionary from: %s", dic_path)
 
         if not dic_path.exists():
-            print(f"❌ File not found: {dic_path}")
+            logger.error("❌ File not found: %s", dic_path)
             return False
 
         try:
-            with dic_path.open('r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
+            if dic_path.stat().st_size == 0:
+                logger.info("   Dictionary contains ~0 words")
+                return True
 
-            # First line is word count
-            word_count = int(lines[0].strip()) if lines else 0
-            print(f"   Dictionary contains ~{word_count:,} words")
+            # Parse as bytes over an mmap: the file is paged in lazily and
+            # lines are pulled straight from the OS cache, with only the
+            # word itself (not the inflection tags) getting decoded
+            with dic_path.open('rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
 
-            # Extract words (remove inflection tags)
-            print(f"\n⚙️  Extracting words...")
+                # First line is word count
+                word_count = int(mm.readline().strip() or 0)
+                logger.info("   Dictionary contains ~%s words", format(word_count, ','))
 
-            processed = 0
-            for line in lines[1:]:
-                processed += 1
+                # Extract words (remove inflection tags)
+                logger.debug("⚙️  Extracting words...")
 
-                if processed % 50000 == 0:
-                    print(f"   Progress: {processed:,} lines, {len(self.words):,} words")
+                for raw in _DIC_WORD_RE.findall(mm, mm.tell()):
+                    word = raw.strip()
 
-                # Hunspell format: word/tags
-                word = line.strip().split('/')[0]
+                    if word:
+                        self.words.add(word.decode('utf-8', 'ignore'))
+                        self.stats['total_extracted'] += 1
 
-                if word and len(word) >= 1:
-                    self.words.add(word)
-                    self.stats['total_extracted'] += 1
-
-            print(f"✅ Extracted {len(self.words):,} total words")
+            logger.info("✅ Extracted %s total words", format(len(self.words), ','))
             return True
 
         except Exception as e:
-            print(f"❌ Error: {e}")
+            logger.error("❌ Error: %s", e)
             return False
 
-    def filter_5letter_words(self):
-        """Filter to keep only 5-letter words, expanding ligatures first"""
-        print(f"\n🔤 Filtering to 5-letter words...")
+    def filter_words(self):
+        """Filter to 5-letter words, dropping capitalized and Roman-numeral
+        entries, in a single pass over the extracted set"""
+        logger.info("🔤 Filtering to 5-letter words...")
 
-        five_letter = set()
+        filtered = set()
 
         for word in self.words:
+            # Only ligature expansion can change a word's length, and
+            # ligatures are non-ASCII: wrong-length ASCII words (the bulk
+            # of the dictionary) are out before any further work
+            if len(word) != 5 and word.isascii():
+                continue
+
             # First, expand ligatures
             expanded_word = self._expand_ligatures(word)
 
             # Check if expanded word is exactly 5 letters
-            if len(expanded_word) == 5:
-                # Allow French accented characters and expanded ligatures
-                if all(c.isalpha() or c in 'àâäéèêëïîôöœùûüæçñ' for c in word):
-                    # Store the expanded version
-                    five_letter.add(expanded_word)
-                    self.stats['five_letter'] += 1
+            if len(expanded_word) != 5:
+                continue
 
-        self.words = five_letter
-
-        print(f"✅ Found {len(self.words):,} five-letter words (ligatures expanded)")
-        return True
+            # Allow French accented characters and expanded ligatures
+            if not _ALLOWED_CHARS.issuperset(word):
+                continue
 
+            self.stats['five_letter'] += 1
 
-    def filter_out_capitalized(self):
-        """Filter out capitalized words"""
-        print(f"\n🔤 Filtering out capitalized words...")
+            # Filter out capitalized words
+            if expanded_word[0].isupper():
+                self.stats['capitalized_filtered'] += 1
+                continue
 
-        filtered = {word for word in self.words if not word[0].isupper()}
-        self.stats['capitalized_filtered'] = len(self.words) - len(filtered)
-        self.words = filtered
+            # Remove Roman numerals
+            if self._contains_roman_numerals(expanded_word):
+                self.stats['roman_numerals_removed'] += 1
+                continue
 
-        print(f"✅ Found {self.stats['capitalized_filtered']:,} capitalized words")
-        return True
+            # Store the expanded version
+            filtered.add(expanded_word)
 
-    def remove_roman_numerals(self):
-        """Remove Roman numerals from words"""
-        print(f"\n🔤 Removing Roman numerals...")
-        filtered = {word for word in self.words if not self._contains_roman_numerals(word)}
-        self.stats['roman_numerals_removed'] = len(self.words) - len(filtered)
         self.words = filtered
-        print(f"✅ Found {self.stats['roman_numerals_removed']:,} words with Roman numerals")
+
+        logger.info("✅ Found %s five-letter words (ligatures expanded)", format(len(self.words), ','))
+        logger.debug("   Dropped %s capitalized words", format(self.stats['capitalized_filtered'], ','))
+        logger.debug("   Dropped %s words with Roman numerals", format(self.stats['roman_numerals_removed'], ','))
         return True
 
     def _contains_roman_numerals(self, word: str) -> bool:
         """Check if word contains Roman numerals (I, V, X, L, C, D, M in sequence)"""
-        # Pattern for Roman numerals: sequences of I, V, X, L, C, D, M
-        # Must be at least 2 characters to avoid single letters
-        roman_pattern = r'[IVXLCDMivxlcdm]{2,}'
-        return bool(re.search(roman_pattern, word))
+        # Must be at least 2 characters to avoid single letters; skip the
+        # regex entirely when no Roman-numeral letter is present at all
+        if not _ROMAN_CHARS.intersection(word):
+            return False
+        return bool(_ROMAN_RE.search(word))
 
     def _expand_ligatures(self, word: str) -> str:
         """Expand French ligatures to their multi-character forms"""
-        ligature_map = {
-            'œ': 'oe',
-            'æ': 'ae',
-            'ﬁ': 'fi',
-            'ﬂ': 'fl',
-        }
+        # Ligatures are all non-ASCII, so pure-ASCII words (the vast
+        # majority of the dictionary) can skip the translation outright
+        if word.isascii():
+            return word
 
-        expanded = word
-        for ligature, expansion in ligature_map.items():
-            expanded = expanded.replace(ligature, expansion)
-
-        return expanded
+        return word.translate(_LIGATURE_TABLE)
 
     def save_to_file(self, filename=None):
         """Save extracted words to file"""
@@ -198,7 +212,7 @@ class LibreOfficeExtractor:
             # Save to data directory relative to script
             filename = Path(__file__).parent.parent / "data" / "french_words_raw.txt"
 
-        print(f"\n💾 Saving to {filename}...")
+        logger.info("💾 Saving to %s...", filename)
 
         try:
             filename = Path(filename)
@@ -206,35 +220,35 @@ class LibreOfficeExtractor:
             filename.parent.mkdir(parents=True, exist_ok=True)
 
             with open(filename, 'w', encoding='utf-8') as f:
-                for word in sorted(self.words):
-                    f.write(word + '\n')
+                # One buffered C-level loop instead of a Python write per word
+                f.writelines(word + '\n' for word in sorted(self.words))
 
-            print(f"✅ Saved {len(self.words):,} words")
+            logger.info("✅ Saved %s words", format(len(self.words), ','))
             return True
 
         except Exception as e:
-            print(f"❌ Error saving: {e}")
+            logger.error("❌ Error saving: %s", e)
             return False
 
     def print_stats(self):
-        """Print statistics"""
-        print("\n" + "="*70)
-        print("EXTRACTION STATISTICS")
-        print("="*70)
-        print(f"Total words extracted:     {self.stats['total_extracted']:,}")
-        print(f"Five-letter words:         {self.stats['five_letter']:,}")
-        print(f"Final count:               {len(self.words):,}")
-        print("="*70)
+        """Log statistics"""
+        logger.info("=" * 70)
+        logger.info("EXTRACTION STATISTICS")
+        logger.info("=" * 70)
+        logger.info("Total words extracted:     %s", format(self.stats['total_extracted'], ','))
+        logger.info("Five-letter words:         %s", format(self.stats['five_letter'], ','))
+        logger.info("Final count:               %s", format(len(self.words), ','))
+        logger.info("=" * 70)
 
     def run(self, dic_path=None):
         """Run complete extraction"""
-        print("="*70)
-        print("LIBREOFFICE DICTIONARY EXTRACTOR")
-        print("="*70)
+        logger.info("=" * 70)
+        logger.info("LIBREOFFICE DICTIONARY EXTRACTOR")
+        logger.info("=" * 70)
 
         if dic_path:
             dic_file = dic_path
-            print(f"📖 Using provided path: {dic_file}")
+            logger.info("📖 Using provided path: %s", dic_file)
         else:
             dic_file = self.find_libreoffice_dict()
 
@@ -244,30 +258,26 @@ class LibreOfficeExtractor:
         if not self.extract_from_dic(dic_file):
             return False
 
-        if not self.filter_5letter_words():
-            return False
-
-        if not self.filter_out_capitalized():
-            return False
-
-        if not self.remove_roman_numerals():
+        if not self.filter_words():
             return False
 
         self.print_stats()
 
         if self.save_to_file():
-            print("\n✅ DONE!")
-            print("\n📝 Next step:")
-            print("   cd scripts && python smart_filter.py")
+            logger.info("✅ DONE!")
+            logger.info("📝 Next step:")
+            logger.info("   cd scripts && python smart_filter.py")
             return True
 
         return False
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     extractor = LibreOfficeExtractor()
     dic_path = sys.argv[1] if len(sys.argv) > 1 else None
     success = extractor.run(dic_path)
 
     if not success:
-        print("\n❌ Extraction failed")
+        logger.error("❌ Extraction failed")
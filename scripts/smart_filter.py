@@ -7,10 +7,120 @@ Keeps accents during filtering, removes them at the end
 
 import re
 import json
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from collections import defaultdict
 from typing import Set
 
+# Optional: orjson serializes string lists several times faster than the
+# stdlib encoder; fall back to json when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Accent/ligature mapping used when normalizing words (final step)
+_ACCENT_MAP = {
+    'à': 'a', 'â': 'a', 'ä': 'a',
+    'é': 'e', 'è': 'e', 'ê': 'e', 'ë': 'e',
+    'ï': 'i', 'î': 'i',
+    'ô': 'o', 'ö': 'o', 'œ': 'oe',
+    'ù': 'u', 'û': 'u', 'ü': 'u',
+    'ç': 'c',
+    'æ': 'ae'
+}
+
+# Compiled to a str.translate table: the whole word is mapped in one C
+# call, multi-character expansions (œ -> oe) included
+_ACCENT_TABLE = str.maketrans(_ACCENT_MAP)
+
+# Letter pairs no French word ends with (Criterion 7); built once at import
+_BAD_ENDINGS = ('nm', 'bd', 'fh', 'jk', 'qx', 'zz', 'ww')
+
+# Vowels (accented included) for Criteria 3 and 8; set membership beats
+# spinning up the regex engine for a plain character-class test
+_VOWELS = frozenset('aeiouyàâäéèêëïîôöœùûüæ')
+
+
+# Words handed to each spell-check worker at a time
+_SPELLCHECK_CHUNK = 2000
+
+# Persistent word -> bool spell-check verdicts, reused across runs while
+# iterating on the heuristics
+_SPELLCHECK_CACHE_FILE = Path(__file__).parent.parent / "data" / ".spellcheck_cache.pkl"
+
+def _load_spell_backend():
+    """Load a French spell-checker: (name, backend, bound check function).
+
+    Prefers the direct hunspell binding (straight C call per lookup),
+    falls back to pyenchant, then to (None, None, None).
+    """
+    try:
+        import hunspell
+        backend = hunspell.HunSpell(
+            '/usr/share/hunspell/fr_FR.dic',
+            '/usr/share/hunspell/fr_FR.aff',
+        )
+        return 'hunspell', backend, backend.spell
+    except Exception:
+        pass
+
+    try:
+        import enchant
+        backend = enchant.Dict("fr_FR")
+        return 'enchant', backend, backend.check
+    except Exception:
+        return None, None, None
+
+# Per-process bound check function; dictionaries aren't picklable, so each
+# worker builds its own via the initializer
+_WORKER_SPELL = None
+
+def _spellcheck_worker_init():
+    global _WORKER_SPELL
+    _WORKER_SPELL = _load_spell_backend()[2]
+
+def _spellcheck_groups_serial(check, groups):
+    """Check (normalized form, variants) groups; a group passes as soon as
+    any of its spelling variants does. Returns (normalized, bool) pairs."""
+    results = []
+    for norm, variants in groups:
+        verdict = False
+        for word in variants:
+            try:
+                if check(word):
+                    verdict = True
+                    break
+            except Exception:
+                pass
+        results.append((norm, verdict))
+
+    return results
+
+def _spellcheck_chunk(groups):
+    """Worker entry point: check a chunk against the per-process dictionary"""
+    if _WORKER_SPELL is None:
+        return []
+
+    return _spellcheck_groups_serial(_WORKER_SPELL, groups)
+
+class _FilterStats:
+    """Pipeline counters; slotted int attributes make the per-word
+    increments a single indexed write instead of two dict lookups"""
+
+    __slots__ = ('rejected_proper_noun', 'rejected_length', 'rejected_no_vowel',
+                 'rejected_double_start', 'rejected_bad_ending',
+                 'rejected_bad_start', 'initial_accepted', 'spellcheck_validated')
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    def total_rejected(self):
+        return (self.rejected_proper_noun + self.rejected_length
+                + self.rejected_no_vowel + self.rejected_double_start
+                + self.rejected_bad_ending + self.rejected_bad_start)
+
 class SmartFilterV2:
     """Advanced filter with spell-check validation"""
 
@@ -19,24 +129,46 @@ class SmartFilterV2:
         self.words_accepted = set()
         self.words_rejected = set()
         self.words_spellcheck_validated = set()
-        self.stats = defaultdict(int)
+        self.stats = _FilterStats()
         self.spellchecker = None
+        self._spell = None  # bound check function of whichever backend loaded
+        self._sc_cache = {}
         self._init_spellchecker()
+        self._load_spellcheck_cache()
 
     def _init_spellchecker(self):
-        """Initialize French spell-checker (pyenchant)"""
+        """Initialize French spell-checker (hunspell, or pyenchant as fallback)"""
         print("📚 Initializing spell-checker...")
 
-        try:
-            import enchant
-            self.spellchecker = enchant.Dict("fr_FR")
-            print("✅ French spell-checker loaded (enchant)")
+        name, self.spellchecker, self._spell = _load_spell_backend()
+
+        if name:
+            print(f"✅ French spell-checker loaded ({name})")
             return True
+
+        print("⚠️  Spell-checker validation disabled: no backend available")
+        print("   (Running with heuristics only)")
+        return False
+
+    def _load_spellcheck_cache(self):
+        """Load spell-check verdicts cached by earlier runs"""
+        try:
+            with open(_SPELLCHECK_CACHE_FILE, 'rb') as f:
+                self._sc_cache = pickle.load(f)
+            print(f"📦 Loaded {len(self._sc_cache):,} cached spell-check results")
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            print(f"⚠️  Spell-checker validation disabled: {e}")
-            print("   (Running with heuristics only)")
-            self.spellchecker = None
-            return False
+            print(f"⚠️  Ignoring unreadable spell-check cache: {e}")
+            self._sc_cache = {}
+
+    def _save_spellcheck_cache(self):
+        """Persist spell-check verdicts for the next run"""
+        try:
+            with open(_SPELLCHECK_CACHE_FILE, 'wb') as f:
+                pickle.dump(self._sc_cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"⚠️  Could not save spell-check cache: {e}")
 
     def load_words(self, filename=None):
         """Load raw words from file"""
@@ -50,13 +182,17 @@ class SmartFilterV2:
             return False
 
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                for line in f:
-                    word = line.strip()
-                    if word:
-                        self.words_raw.add(word)
+            # One read, one C-level split: str.split() with no argument
+            # drops blank lines and surrounding whitespace on its own
+            words = set(Path(filename).read_text(encoding='utf-8').split())
+
+            # Proper nouns never survive Criterion 1, so dropping them at
+            # load time shrinks every downstream pass
+            self.words_raw = {w for w in words if not w[0].isupper()}
+            self.stats.rejected_proper_noun += len(words) - len(self.words_raw)
 
-            print(f"✅ Loaded {len(self.words_raw)} words")
+            print(f"✅ Loaded {len(self.words_raw)} words "
+                  f"({self.stats.rejected_proper_noun} capitalized dropped)")
             return True
 
         except Exception as e:
@@ -80,132 +216,155 @@ class SmartFilterV2:
         print(f"\n💾 Saving spell-check validated words to: {filename}...")
 
     def _is_valid_word(self, word: str) -> bool:
-        """Check if word passes initial heuristics"""
+        """Check if word passes initial heuristics.
+
+        Criteria run cheapest and most-rejecting first so the average
+        word exits as early as possible; the numbering is historical.
+        """
+
+        # Criterion 2: Length check (rejects the bulk of the raw list
+        # with two integer compares)
+        if len(word) < 3 or len(word) > 5:
+            self.stats.rejected_length += 1
+            return False
 
         # Criterion 1: Reject proper nouns (starts with uppercase)
-        if word and word[0].isupper():
-            self.stats['rejected_proper_noun'] += 1
+        if word[0].isupper():
+            self.stats.rejected_proper_noun += 1
             return False
 
-        # Criterion 2: Length check
-        if len(word) < 3 or len(word) > 5:
-            self.stats['rejected_length'] += 1
+        # Criterion 6: Reject double letters at start
+        if word[0] == word[1]:
+            self.stats.rejected_double_start += 1
+            return False
+
+        # Criterion 7: Reject bad endings (endswith checks the whole
+        # tuple of suffixes in one C call)
+        if word.endswith(_BAD_ENDINGS):
+            self.stats.rejected_bad_ending += 1
             return False
 
         # Criterion 3: Must contain at least one vowel
-        if not re.search(r'[aeiouyàâäéèêëïîôöœùûüæ]', word):
-            self.stats['rejected_no_vowel'] += 1
+        if not any(c in _VOWELS for c in word):
+            self.stats.rejected_no_vowel += 1
             return False
 
         # Criterion 4: Reject excessive consonant clusters (>3)
         # if re.search(r'[bcdfghjklmnpqrstvwxyz]{4,}', word):
-        #     self.stats['rejected_consonant_cluster'] += 1
+        #     self.stats.rejected_consonant_cluster += 1
         #     return False
 
         # Criterion 5: Reject excessive vowel clusters (>3)
         # if re.search(r'[aeiouyàâäéèêëïîôöœùûüæ]{4,}', word):
-        #     self.stats['rejected_vowel_cluster'] += 1
+        #     self.stats.rejected_vowel_cluster += 1
         #     return False
 
-        # Criterion 6: Reject double letters at start
-        if len(word) > 1 and word[0] == word[1]:
-            self.stats['rejected_double_start'] += 1
-            return False
-
-        # Criterion 7: Reject bad endings
-        bad_endings = ['nm', 'bd', 'fh', 'jk', 'qx', 'zz', 'ww']
-        if any(word.endswith(e) for e in bad_endings):
-            self.stats['rejected_bad_ending'] += 1
+        # Criterion 8: Must start with vowel OR 1-3 consonants then a
+        # vowel -- i.e. a vowel within the first four characters (length
+        # is already >= 3 here, so indexes 0-2 are safe)
+        if (word[0] not in _VOWELS and word[1] not in _VOWELS
+                and word[2] not in _VOWELS
+                and (len(word) < 4 or word[3] not in _VOWELS)):
+            self.stats.rejected_bad_start += 1
             return False
 
-        # Criterion 8: Must start with vowel OR consonant+vowel
-        if not re.match(r'^([aeiouyàâäéèêëïîôöœùûüæ]|[bcdfghjklmnpqrstvwxyz]{1,3}[aeiouyàâäéèêëïîôöœùûüæ])', word):
-            self.stats['rejected_bad_start'] += 1
-            return False    
-
         return True
 
     def _normalize_word(self, word: str) -> str:
         """Remove accents from word (final step)"""
-        accent_map = {
-            'à': 'a', 'â': 'a', 'ä': 'a',
-            'é': 'e', 'è': 'e', 'ê': 'e', 'ë': 'e',
-            'ï': 'i', 'î': 'i',
-            'ô': 'o', 'ö': 'o', 'œ': 'oe',
-            'ù': 'u', 'û': 'u', 'ü': 'u',
-            'ç': 'c',
-            'æ': 'ae'
-        }
-
-        normalized = ""
-        for char in word.lower():
-            normalized += accent_map.get(char, char)
-
-        return normalized
+        word = word.lower()
+
+        # Fast path: most dictionary words are pure ASCII and need no mapping
+        if word.isascii():
+            return word
+
+        return word.translate(_ACCENT_TABLE)
 
     def _check_spellcheck(self, word: str) -> bool:
-        """Check word against spell-checker"""
+        """Check word against spell-checker (cached verdicts first; the
+        cache is keyed by normalized form, like the validation pass)"""
         if not self.spellchecker:
             return False
 
+        norm = self._normalize_word(word)
+        cached = self._sc_cache.get(norm)
+        if cached is not None:
+            return cached
+
         try:
-            return self.spellchecker.check(word)
+            result = bool(self._spell(word))
         except:
             return False
 
+        self._sc_cache[norm] = result
+        return result
+
     def filter_words(self):
         """Filter words with heuristics and spell-check validation"""
         print("\n⚙️  Filtering words with heuristics...")
 
-        initial_accepted = set()
-        to_spellcheck = set()
-
-        for word in self.words_raw:
-            if self._is_valid_word(word):
-                initial_accepted.add(word)
-            else:
-                to_spellcheck.add(word)
+        # Partition with one predicate pass plus a C-level set difference
+        initial_accepted = {w for w in self.words_raw if self._is_valid_word(w)}
+        to_spellcheck = self.words_raw - initial_accepted
 
-        self.stats['initial_accepted'] = len(initial_accepted)
+        self.stats.initial_accepted = len(initial_accepted)
         self.words_accepted = initial_accepted
 
-        # Spell-check validation for rejected words
+        # Spell-check validation for rejected words: each lookup is
+        # independent, so fan the chunks out across worker processes
         if self.spellchecker and to_spellcheck:
             print(f"\n🔤 Validating {len(to_spellcheck)} rejected words with spell-checker...")
 
-            validated = 0
-            for i, word in enumerate(to_spellcheck):
-                if i % 500 == 0:
-                    print(f"  Progress: {i}/{len(to_spellcheck)} checked, {validated} validated")
-
-                if self._check_spellcheck(word):
-                    self.words_spellcheck_validated.add(word)
-                    self.words_accepted.add(word)
-                    self.stats['spellcheck_validated'] += 1
-                    validated += 1
-                else:
-                    self.words_rejected.add(word)
-
-            print(f"✅ Spell-check validation complete: {validated} words validated")
+            # The game list ships normalized, so one verdict per normalized
+            # form covers all its case/accent variants; the cache (keyed by
+            # normalized form) then skips whole groups from earlier runs
+            groups = {}
+            for word in to_spellcheck:
+                groups.setdefault(self._normalize_word(word), []).append(word)
+
+            validated = set()
+            to_check = []
+            for norm, variants in groups.items():
+                cached = self._sc_cache.get(norm)
+                if cached is None:
+                    to_check.append((norm, variants))
+                elif cached:
+                    validated.update(variants)
+
+            if to_check:
+                to_check.sort()
+                chunks = [to_check[i:i + _SPELLCHECK_CHUNK]
+                          for i in range(0, len(to_check), _SPELLCHECK_CHUNK)]
+
+                verdicts = []
+                try:
+                    with ProcessPoolExecutor(initializer=_spellcheck_worker_init) as pool:
+                        for chunk_verdicts in pool.map(_spellcheck_chunk, chunks):
+                            verdicts.extend(chunk_verdicts)
+                except Exception as e:
+                    # Workers unavailable (restricted platform): check serially
+                    print(f"⚠️  Parallel spell-check failed ({e}); running serially")
+                    verdicts = _spellcheck_groups_serial(self._spell, to_check)
+
+                for norm, verdict in verdicts:
+                    self._sc_cache[norm] = verdict
+                    if verdict:
+                        validated.update(groups[norm])
+                self._save_spellcheck_cache()
+
+            self.words_spellcheck_validated = validated
+            self.words_accepted |= validated
+            self.words_rejected = to_spellcheck - validated
+            self.stats.spellcheck_validated = len(validated)
+
+            print(f"✅ Spell-check validation complete: {len(validated)} words validated")
         else:
             self.words_rejected = to_spellcheck
 
-        # Final step: Remove accents
+        # Final step: Remove accents (rejected words too, for review files)
         print(f"\n🔤 Normalizing accents...")
-        normalized_words = set()
-        for word in self.words_accepted:
-            normalized = self._normalize_word(word)
-            normalized_words.add(normalized)
-
-        self.words_accepted = normalized_words
-
-        # Normalize rejected words too
-        normalized_rejected = set()
-        for word in self.words_rejected:
-            normalized = self._normalize_word(word)
-            normalized_rejected.add(normalized)
-
-        self.words_rejected = normalized_rejected
+        self.words_accepted = {self._normalize_word(w) for w in self.words_accepted}
+        self.words_rejected = {self._normalize_word(w) for w in self.words_rejected}
 
         print(f"✅ Normalization complete")
 
@@ -215,9 +374,9 @@ class SmartFilterV2:
         print("FILTERING STATISTICS")
         print("="*70)
 
-        total_rejected = sum(v for k, v in self.stats.items() if k.startswith('rejected_'))
-        total_heuristic_accepted = self.stats.get('initial_accepted', 0)
-        total_spellcheck_validated = self.stats.get('spellcheck_validated', 0)
+        total_rejected = self.stats.total_rejected()
+        total_heuristic_accepted = self.stats.initial_accepted
+        total_spellcheck_validated = self.stats.spellcheck_validated
 
         print(f"\n📊 HEURISTIC FILTERING:")
         print(f"   ✅ Accepted by heuristics:  {total_heuristic_accepted:,}")
@@ -243,20 +402,26 @@ class SmartFilterV2:
 
         words_sorted = sorted(self.words_accepted)
 
-        js_content = "// French Wordle Words - Smart Filtered with Spell-Check\n"
-        js_content += "// Generated automatically from LibreOffice dictionary\n"
-        js_content += f"// Total words: {len(words_sorted)}\n"
-        js_content += f"// (Accents normalized)\n\n"
-        js_content += "const TARGET_WORDS = " + json.dumps(words_sorted, ensure_ascii=False) + ";\n\n"
-        js_content += "const VALID_GUESSES = TARGET_WORDS;\n\n"
-        js_content += "// Stats\n"
-        js_content += f"console.log('Loaded {len(words_sorted)} French words (spell-check validated)');\n"
-        js_content += f"console.log('Target words: ' + TARGET_WORDS.length);\n"
-        js_content += f"console.log('Valid guesses: ' + VALID_GUESSES.length);\n"
-
         try:
+            # Stream straight to the file: json.dump serializes the word
+            # array in chunks instead of building one big string in memory
             with open(filename, 'w', encoding='utf-8') as f:
-                f.write(js_content)
+                f.write("// French Wordle Words - Smart Filtered with Spell-Check\n")
+                f.write("// Generated automatically from LibreOffice dictionary\n")
+                f.write(f"// Total words: {len(words_sorted)}\n")
+                f.write("// (Accents normalized)\n\n")
+                f.write("const TARGET_WORDS = ")
+                if orjson is not None:
+                    # always emits compact UTF-8, no escaping needed
+                    f.write(orjson.dumps(words_sorted).decode('utf-8'))
+                else:
+                    json.dump(words_sorted, f, ensure_ascii=False)
+                f.write(";\n\n")
+                f.write("const VALID_GUESSES = TARGET_WORDS;\n\n")
+                f.write("// Stats\n")
+                f.write(f"console.log('Loaded {len(words_sorted)} French words (spell-check validated)');\n")
+                f.write("console.log('Target words: ' + TARGET_WORDS.length);\n")
+                f.write("console.log('Valid guesses: ' + VALID_GUESSES.length);\n")
 
             print(f"✅ Generated: {filename}")
             print(f"   Words: {len(words_sorted):,}")
@@ -275,8 +440,9 @@ class SmartFilterV2:
 
         try:
             with open(filename, 'w', encoding='utf-8') as f:
-                for word in sorted(self.words_rejected):
-                    f.write(word + '\n')
+                # One join and one write instead of a call per word
+                if self.words_rejected:
+                    f.write('\n'.join(sorted(self.words_rejected)) + '\n')
 
             print(f"✅ Saved {len(self.words_rejected):,} rejected words")
             return True
@@ -294,8 +460,9 @@ class SmartFilterV2:
 
         try:
             with open(filename, 'w', encoding='utf-8') as f:
-                for word in sorted(self.words_spellcheck_validated):
-                    f.write(word + '\n')
+                # One join and one write instead of a call per word
+                if self.words_spellcheck_validated:
+                    f.write('\n'.join(sorted(self.words_spellcheck_validated)) + '\n')
 
             print(f"✅ Saved {len(self.words_spellcheck_validated):,} validated words")
             return True